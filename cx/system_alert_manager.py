@@ -55,6 +55,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Validation patterns, compiled once at import
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')  # RFC 5322 (simplified)
+_USER_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
 
 class SecurityConfig:
     """Enterprise security configuration."""
@@ -102,9 +106,7 @@ class SecurityValidator:
         if not email or len(email) > 254:
             return False
 
-        # RFC 5322 compliant regex (simplified)
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_PATTERN.match(email))
 
     @staticmethod
     def validate_user_id(user_id: str) -> bool:
@@ -112,7 +114,7 @@ class SecurityValidator:
         if not user_id or len(user_id) > 128:
             return False
         # Allow alphanumeric, hyphens, underscores
-        return bool(re.match(r'^[a-zA-Z0-9_-]+$', user_id))
+        return bool(_USER_ID_PATTERN.match(user_id))
 
     @staticmethod
     def validate_amount(amount: Union[Decimal, float, str]) -> bool: